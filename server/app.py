@@ -31,6 +31,12 @@ def create_app() -> Flask:
     app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1, x_host=1)
     
     init_app(app)
+
+    # Opt-in background warming of the data cache for popular tickers
+    if os.environ.get('ENABLE_CACHE_PREFETCH', '').lower() in ('1', 'true', 'yes'):
+        from src.external.clients.api import start_prefetch_scheduler
+        start_prefetch_scheduler()
+
     return app
 
 if __name__ == '__main__':
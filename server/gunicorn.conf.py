@@ -0,0 +1,22 @@
+"""Gunicorn settings for serving the API with long-lived SSE streams.
+
+Run with:
+    gunicorn -c gunicorn.conf.py "app:create_app()"
+"""
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Each open analysis stream holds a thread, not a whole worker process, so
+# idle SSE clients are cheap and one slow stream no longer blocks the rest.
+worker_class = "gthread"
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count()))
+threads = int(os.environ.get('GUNICORN_THREADS', 64))
+
+# gthread workers heartbeat from their main loop, not per request, so this
+# only restarts a worker that has stopped responding; long streams are
+# not cut off by it.
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 75
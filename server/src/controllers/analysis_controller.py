@@ -1,6 +1,5 @@
 from typing import Dict, Any
-from flask import request, jsonify, Response, stream_with_context
-from src.services.analysis_service import AnalysisService
+from flask import request, Response
 from src.models.dto.requests import AnalysisRequestDTO
 from src.core.exceptions import ValidationError, BusinessLogicError
 from src.utils.validators import validate_analysis_request
@@ -10,22 +9,59 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Pre-rendered SSE error frame; only the message and timestamp vary per error
+_ERROR_EVENT_TEMPLATE = b'data: {"type": "error", "message": %s, "timestamp": "%s"}\n\n'
+
+def _stream_headers(protocol: str) -> Dict[str, str]:
+    """Build SSE response headers for the request's HTTP protocol."""
+    headers = {
+        # no-transform keeps intermediaries from recompressing the stream
+        'Cache-Control': 'no-cache, no-transform',
+        # Keep proxies from buffering the stream; each event must be
+        # flushed as it is yielded
+        'X-Accel-Buffering': 'no',
+        'Access-Control-Allow-Origin': '*'
+    }
+    # Connection-specific headers are only valid on HTTP/1.1
+    if protocol == 'HTTP/1.1':
+        headers['Connection'] = 'keep-alive'
+        headers['Transfer-Encoding'] = 'chunked'
+    return headers
+
+def _json_error(payload: Dict[str, Any], status: int) -> Response:
+    """Build a small JSON error response without going through jsonify."""
+    return Response(json.dumps(payload), status=status, mimetype='application/json')
+
+_analysis_service = None
+
+def _get_analysis_service():
+    """Import and build the analysis service on first use."""
+    global _analysis_service
+    if _analysis_service is None:
+        # Deferred: pulls in the agent graph, LLM SDKs and pandas
+        from src.services.analysis_service import AnalysisService
+        _analysis_service = AnalysisService()
+    return _analysis_service
+
 class AnalysisController:
     """Controller for handling analysis-related HTTP requests."""
     
-    def __init__(self):
-        self.analysis_service = AnalysisService()
+    __slots__ = ()
+    
+    @property
+    def analysis_service(self):
+        return _get_analysis_service()
     
     def generate_analysis(self) -> Response:
         """Handle analysis generation requests."""
         try:
             data = request.get_json()
             if not data:
-                return jsonify({'error': 'No data provided'}), 400
+                return _json_error({'error': 'No data provided'}, 400)
             
             validation_errors = validate_analysis_request(data)
             if validation_errors:
-                return jsonify({'errors': validation_errors}), 400
+                return _json_error({'errors': validation_errors}, 400)
             
             request_dto = AnalysisRequestDTO.from_dict(data)
             
@@ -54,35 +90,28 @@ class AnalysisController:
                         
                 except Exception as e:
                     logger.error(f"Error in streaming: {str(e)}")
-                    error_event = {
-                        "type": "error",
-                        "message": str(e),
-                        "timestamp": datetime.now().isoformat()
-                    }
-                    yield f"data: {json.dumps(error_event)}\n\n".encode('utf-8')
+                    yield _ERROR_EVENT_TEMPLATE % (
+                        json.dumps(str(e)).encode('ascii'),
+                        datetime.now().isoformat().encode('ascii')
+                    )
             
-            # Create Flask Response with generator
+            # The generator never reads flask.request, so it is streamed
+            # without re-pushing the request context for every chunk
             return Response(
-                stream_with_context(generate()),
+                generate(),
                 mimetype='text/event-stream',
-                headers={
-                    'Cache-Control': 'no-cache',
-                    'X-Accel-Buffering': 'no',
-                    'Connection': 'keep-alive',
-                    'Access-Control-Allow-Origin': '*',
-                    'Transfer-Encoding': 'chunked'
-                },
+                headers=_stream_headers(request.environ.get('SERVER_PROTOCOL', '')),
                 direct_passthrough=True
             )
             
         except ValidationError as e:
             logger.warning(f"Validation error: {str(e)}")
-            return jsonify({'error': str(e)}), 400
+            return _json_error({'error': str(e)}, 400)
             
         except BusinessLogicError as e:
             logger.error(f"Business logic error: {str(e)}")
-            return jsonify({'error': str(e)}), 422
+            return _json_error({'error': str(e)}, 422)
             
         except Exception as e:
             logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-            return jsonify({'error': 'Internal server error'}), 500 
\ No newline at end of file
+            return _json_error({'error': 'Internal server error'}, 500) 
\ No newline at end of file
@@ -1,65 +1,252 @@
+import threading
+import time
+from bisect import bisect_left, bisect_right
+
+
+# Company profiles (currency, market cap) change slowly; refetch hourly
+PROFILE_TTL_SECONDS = 3600
+
+# How long a confirmed-empty fetch is remembered before asking the API again
+EMPTY_RESULT_TTL_SECONDS = 300
+
+
 class Cache:
     """In-memory cache for API responses."""
 
     def __init__(self):
-        self._prices_cache: dict[str, list[dict[str, any]]] = {}
-        self._financial_metrics_cache: dict[str, list[dict[str, any]]] = {}
-        self._line_items_cache: dict[str, list[dict[str, any]]] = {}
-        self._insider_trades_cache: dict[str, list[dict[str, any]]] = {}
-        self._company_news_cache: dict[str, list[dict[str, any]]] = {}
+        # Per ticker, one immutable (rows, keys, expiries, windows) entry: the
+        # rows sorted by date, their sort keys (for bisect range lookups), each
+        # row's expiry time (None keeps it forever) and the (start, end, expiry)
+        # date windows that were actually fetched. Writers replace the whole
+        # entry in one assignment, so a reader always sees a matching set.
+        # Expiry is per row so a short-lived write (e.g. today's forming bar)
+        # doesn't shorten the life of rows cached earlier with a longer TTL.
+        self._prices_cache: dict[str, tuple[list[dict[str, any]], list[str], list[float | None], list[tuple[str, str, float | None]]]] = {}
+        self._financial_metrics_cache: dict[str, tuple[list[dict[str, any]], list[str], list[float | None], list[tuple[str, str, float | None]]]] = {}
+        self._line_items_cache: dict[str, tuple[list[dict[str, any]], list[str], list[float | None], list[tuple[str, str, float | None]]]] = {}
+        self._insider_trades_cache: dict[str, tuple[list[dict[str, any]], list[str], list[float | None], list[tuple[str, str, float | None]]]] = {}
+        self._company_news_cache: dict[str, tuple[list[dict[str, any]], list[str], list[float | None], list[tuple[str, str, float | None]]]] = {}
+        self._company_profile_cache: dict[str, tuple[float, dict[str, any]]] = {}
+        # (ticker, period) -> (expiry, extracted reported financials), shared by
+        # the metrics and line item lookups so one fetch serves both
+        self._reported_financials_cache: dict[tuple[str, str], tuple[float, list]] = {}
+        # (dataset, ticker, start_date, end_date) -> expiry of a known-empty result
+        self._empty_results: dict[tuple, float] = {}
+
+        # Serializes merges so concurrent writes to a ticker don't drop each
+        # other's rows; readers never take it
+        self._write_lock = threading.Lock()
+
+    @staticmethod
+    def _sort_key(row: dict, sort_field: str) -> str:
+        """Sort key for a cached row; missing dates sort first as "" so keys stay comparable."""
+        return row[sort_field] or ""
+
+    def _store_sorted(self, cache: dict, ticker: str, data: list[dict], key_field: str, sort_field: str, ttl: float | None = None, window: tuple[str | None, str] | None = None):
+        """Merge new rows into a cache kept sorted by sort_field, replacing the ticker's entry.
+
+        Rows already cached (by key_field) keep their own expiry; only the rows
+        this write adds expire ttl seconds from now. window is the (start, end)
+        date range the rows were fetched for, start None meaning open-ended;
+        it defaults to the span of the rows themselves.
+        """
+        with self._write_lock:
+            now = time.monotonic()
+            expires_at = None if ttl is None else now + ttl
+
+            rows, _, expiries, windows = cache.get(ticker, ((), (), (), ()))
+            windows = [fetched for fetched in windows if fetched[2] is None or fetched[2] > now]
+            if window is None and data:
+                sort_keys = [self._sort_key(row, sort_field) for row in data]
+                window = (min(sort_keys), max(sort_keys))
+            if window is not None:
+                start, end = window[0] or "", window[1]
+                # Windows inside the new one that would expire no later are redundant
+                windows = [
+                    fetched for fetched in windows
+                    if not (start <= fetched[0] and fetched[1] <= end and self._expires_by(fetched[2], expires_at))
+                ]
+                windows.append((start, end, expires_at))
+                windows.sort()
+
+            # Expired rows are dropped, so fresh copies of them are added below
+            kept = [
+                (row, row_expiry)
+                for row, row_expiry in zip(rows, expiries)
+                if row_expiry is None or row_expiry > now
+            ]
+            existing_keys = {row[key_field] for row, _ in kept}
+            kept.extend((row, expires_at) for row in data if row[key_field] not in existing_keys)
+            kept.sort(key=lambda entry: self._sort_key(entry[0], sort_field))
+
+            cache[ticker] = (
+                [row for row, _ in kept],
+                [self._sort_key(row, sort_field) for row, _ in kept],
+                [row_expiry for _, row_expiry in kept],
+                windows,
+            )
+
+    @staticmethod
+    def _expires_by(expiry: float | None, deadline: float | None) -> bool:
+        """Whether something expiring at expiry is gone by deadline (None never expires)."""
+        return deadline is None or (expiry is not None and expiry <= deadline)
+
+    @staticmethod
+    def _covers(windows: list[tuple[str, str, float | None]], start: str, end: str, now: float) -> bool:
+        """Whether unexpired fetched windows together span all of [start, end]."""
+        needed = start
+        for window_start, window_end, expiry in windows:
+            if expiry is not None and expiry <= now:
+                continue
+            # Windows are sorted by start, so a later one can't fill a gap
+            if window_start > needed:
+                return False
+            if window_end >= end:
+                return True
+            needed = max(needed, window_end)
+        return False
 
-    def _merge_data(self, existing: list[dict] | None, new_data: list[dict], key_field: str) -> list[dict]:
-        """Merge existing and new data, avoiding duplicates based on a key field."""
-        if not existing:
-            return new_data
+    @staticmethod
+    def _ensure_period(data: list[dict]):
+        """Give every row a "period" key (default "ttm") so readers can index it directly."""
+        for row in data:
+            if "period" not in row:
+                row["period"] = "ttm"
 
-        # Create a set of existing keys for O(1) lookup
-        existing_keys = {item[key_field] for item in existing}
+    def _range(self, cache: dict, ticker: str, start: str | None, end: str) -> list[dict]:
+        """Return the cached rows whose sort key falls within [start, end]."""
+        entry = cache.get(ticker)
+        if entry is None:
+            return []
+        rows, keys, expiries, windows = entry
+        now = time.monotonic()
+        # Rows that only overlap the range (e.g. a shorter window fetched
+        # earlier) would be a silent partial answer; refetch instead
+        if not self._covers(windows, start or "", end, now):
+            return []
+        lo = 0 if start is None else bisect_left(keys, start)
+        hi = bisect_right(keys, end)
+        # Any expired row in the range makes it a miss, so the caller refetches
+        # the whole range instead of getting a partial answer
+        if any(row_expiry is not None and row_expiry <= now for row_expiry in expiries[lo:hi]):
+            return []
+        return rows[lo:hi]
 
-        # Only add items that don't exist yet
-        merged = existing.copy()
-        merged.extend([item for item in new_data if item[key_field] not in existing_keys])
-        return merged
+    def _rows(self, cache: dict, ticker: str) -> list[dict] | None:
+        """Return every cached row for ticker, oldest first."""
+        entry = cache.get(ticker)
+        return None if entry is None else entry[0]
 
     def get_prices(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached price data if available."""
-        return self._prices_cache.get(ticker)
+        return self._rows(self._prices_cache, ticker)
 
-    def set_prices(self, ticker: str, data: list[dict[str, any]]):
+    def set_prices(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None, window: tuple[str | None, str] | None = None):
         """Append new price data to cache."""
-        self._prices_cache[ticker] = self._merge_data(self._prices_cache.get(ticker), data, key_field="time")
+        self._store_sorted(self._prices_cache, ticker, data, key_field="time", sort_field="time", ttl=ttl, window=window)
+
+    def get_prices_range(self, ticker: str, start_date: str, end_date: str) -> list[dict[str, any]]:
+        """Get cached prices with start_date <= time <= end_date, oldest first."""
+        return self._range(self._prices_cache, ticker, start_date, end_date)
 
     def get_financial_metrics(self, ticker: str) -> list[dict[str, any]]:
         """Get cached financial metrics if available."""
-        return self._financial_metrics_cache.get(ticker)
+        return self._rows(self._financial_metrics_cache, ticker)
 
-    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]]):
+    def set_financial_metrics(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None, window: tuple[str | None, str] | None = None):
         """Append new financial metrics to cache."""
-        self._financial_metrics_cache[ticker] = self._merge_data(self._financial_metrics_cache.get(ticker), data, key_field="report_period")
+        self._ensure_period(data)
+        self._store_sorted(self._financial_metrics_cache, ticker, data, key_field="report_period", sort_field="report_period", ttl=ttl, window=window)
+
+    def get_financial_metrics_range(self, ticker: str, start_date: str | None, end_date: str) -> list[dict[str, any]]:
+        """Get cached financial metrics reported within the date range, oldest first."""
+        return self._range(self._financial_metrics_cache, ticker, start_date, end_date)
 
     def get_line_items(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached line items if available."""
-        return self._line_items_cache.get(ticker)
+        return self._rows(self._line_items_cache, ticker)
 
-    def set_line_items(self, ticker: str, data: list[dict[str, any]]):
+    def set_line_items(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None, window: tuple[str | None, str] | None = None):
         """Append new line items to cache."""
-        self._line_items_cache[ticker] = self._merge_data(self._line_items_cache.get(ticker), data, key_field="report_period")
+        self._ensure_period(data)
+        self._store_sorted(self._line_items_cache, ticker, data, key_field="report_period", sort_field="report_period", ttl=ttl, window=window)
+
+    def get_line_items_range(self, ticker: str, start_date: str | None, end_date: str) -> list[dict[str, any]]:
+        """Get cached line items reported within the date range, oldest first."""
+        return self._range(self._line_items_cache, ticker, start_date, end_date)
 
     def get_insider_trades(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached insider trades if available."""
-        return self._insider_trades_cache.get(ticker)
+        return self._rows(self._insider_trades_cache, ticker)
 
-    def set_insider_trades(self, ticker: str, data: list[dict[str, any]]):
+    def set_insider_trades(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None, window: tuple[str | None, str] | None = None):
         """Append new insider trades to cache."""
-        self._insider_trades_cache[ticker] = self._merge_data(self._insider_trades_cache.get(ticker), data, key_field="filing_date")  # Could also use transaction_date if preferred
+        # Deduplicated by filing date but ordered by transaction date, which is what callers filter on
+        self._store_sorted(self._insider_trades_cache, ticker, data, key_field="filing_date", sort_field="transaction_date", ttl=ttl, window=window)
+
+    def get_insider_trades_range(self, ticker: str, start_date: str | None, end_date: str) -> list[dict[str, any]]:
+        """Get cached insider trades transacted within the date range, oldest first."""
+        return self._range(self._insider_trades_cache, ticker, start_date, end_date)
 
     def get_company_news(self, ticker: str) -> list[dict[str, any]] | None:
         """Get cached company news if available."""
-        return self._company_news_cache.get(ticker)
+        return self._rows(self._company_news_cache, ticker)
 
-    def set_company_news(self, ticker: str, data: list[dict[str, any]]):
+    def set_company_news(self, ticker: str, data: list[dict[str, any]], ttl: float | None = None, window: tuple[str | None, str] | None = None):
         """Append new company news to cache."""
-        self._company_news_cache[ticker] = self._merge_data(self._company_news_cache.get(ticker), data, key_field="date")
+        self._store_sorted(self._company_news_cache, ticker, data, key_field="date", sort_field="date", ttl=ttl, window=window)
+
+    def get_company_news_range(self, ticker: str, start_date: str | None, end_date: str) -> list[dict[str, any]]:
+        """Get cached company news dated within the date range, oldest first."""
+        return self._range(self._company_news_cache, ticker, start_date, end_date)
+
+
+    def get_company_profile(self, ticker: str) -> dict[str, any] | None:
+        """Get a cached company profile if it has not expired."""
+        entry = self._company_profile_cache.get(ticker)
+        if entry is None:
+            return None
+        expires_at, profile = entry
+        if time.monotonic() >= expires_at:
+            self._company_profile_cache.pop(ticker, None)
+            return None
+        return profile
+
+    def set_company_profile(self, ticker: str, profile: dict[str, any], ttl: float = PROFILE_TTL_SECONDS):
+        """Cache a company profile for ttl seconds."""
+        self._company_profile_cache[ticker] = (time.monotonic() + ttl, profile)
+
+    def get_reported_financials(self, ticker: str, period: str) -> list | None:
+        """Get cached extracted reported financials if they have not expired."""
+        key = (ticker, period)
+        entry = self._reported_financials_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if time.monotonic() >= expires_at:
+            self._reported_financials_cache.pop(key, None)
+            return None
+        return data
+
+    def set_reported_financials(self, ticker: str, period: str, data: list, ttl: float):
+        """Cache extracted reported financials for ttl seconds."""
+        self._reported_financials_cache[(ticker, period)] = (time.monotonic() + ttl, data)
+
+
+    def is_known_empty(self, dataset: str, ticker: str, start_date: str | None, end_date: str) -> bool:
+        """Check whether a fetch for this range recently came back empty."""
+        key = (dataset, ticker, start_date, end_date)
+        expires_at = self._empty_results.get(key)
+        if expires_at is None:
+            return False
+        if time.monotonic() >= expires_at:
+            self._empty_results.pop(key, None)
+            return False
+        return True
+
+    def mark_empty(self, dataset: str, ticker: str, start_date: str | None, end_date: str, ttl: float = EMPTY_RESULT_TTL_SECONDS):
+        """Remember that a fetch for this range returned nothing."""
+        self._empty_results[(dataset, ticker, start_date, end_date)] = time.monotonic() + ttl
 
 
 # Global cache instance
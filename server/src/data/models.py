@@ -1,8 +1,21 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from enum import Enum
+from typing import NamedTuple
 
 
 class Price(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    open: float
+    close: float
+    high: float
+    low: float
+    volume: int
+    time: str
+
+
+class PriceNT(NamedTuple):
+    """Lightweight price bar for internal series work; same fields as Price."""
     open: float
     close: float
     high: float
@@ -81,6 +94,8 @@ class LineItemResponse(BaseModel):
 
 
 class InsiderTrade(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     issuer: str | None
     name: str | None
@@ -101,6 +116,8 @@ class InsiderTradeResponse(BaseModel):
 
 
 class CompanyNews(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     ticker: str
     title: str
     author: str
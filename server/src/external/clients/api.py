@@ -1,7 +1,13 @@
 import datetime
+import numpy as np
 import pandas as pd
 import logging
-from typing import Optional, List
+import threading
+from collections import Counter
+from itertools import islice
+from typing import Optional, List, Dict, Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import wraps
 from datetime import datetime, timedelta
 
 from src.data.cache import get_cache
@@ -9,6 +15,7 @@ from src.data.models import (
     CompanyNews,
     FinancialMetrics,
     Price,
+    PriceNT,
     LineItem,
     InsiderTrade,
     LineItemName,
@@ -17,7 +24,11 @@ from src.data.models import (
 from src.external.clients.polygon_client import PolygonClient
 from src.external.clients.alpaca_client import AlpacaClient
 from src.external.clients.financial_calculator import FinancialCalculator
-from src.external.clients.field_adapters import FieldMappingService, PolygonFieldMappingService
+from src.external.clients.field_adapters import (
+    FieldMappingService,
+    PolygonFieldMappingService,
+    PolygonFinancialData,
+)
 
 
 logging.basicConfig(level=logging.DEBUG)
@@ -32,15 +43,121 @@ alpaca_client = AlpacaClient()
 financial_calculator = FinancialCalculator()
 field_mapping_service = FieldMappingService()
 polygon_field_mapping_service = PolygonFieldMappingService()
-
+# Stateless and shared with the mapping service, so one instance serves every call
+_FIN_ADAPTER = polygon_field_mapping_service.polygon_adapter
+
+# Cache lifetimes matched to how often each dataset changes upstream
+PRICES_HISTORICAL_TTL_SECONDS = 6 * 60 * 60
+PRICES_LIVE_TTL_SECONDS = 60
+FINANCIAL_METRICS_TTL_SECONDS = 24 * 60 * 60
+INSIDER_TRADES_TTL_SECONDS = 12 * 60 * 60
+COMPANY_NEWS_TTL_SECONDS = 60 * 60
+
+# Every FinancialMetrics field set to None, the base of each fetched row. The
+# adapter only derives a subset (margins, liquidity, leverage, per-share); price
+# multiples, EV ratios, growth, ROIC, payout... need data it doesn't have.
+_EMPTY_METRICS = dict.fromkeys(FinancialMetrics.model_fields)
+
+# Shared pool for overlapping independent upstream requests within one call
+_io_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="api-io")
+
+# Per-ticker request counts since the last prefetch run
+_ticker_hits: Counter = Counter()
+_ticker_hits_lock = threading.Lock()
+_prefetch_state = threading.local()
+
+PREFETCH_INTERVAL_SECONDS = 4 * 60 * 60
+
+def _record_hit(ticker: str) -> None:
+    """Count a lookup for ticker, ignoring the prefetcher's own calls."""
+    if getattr(_prefetch_state, "active", False):
+        return
+    with _ticker_hits_lock:
+        _ticker_hits[ticker] += 1
+
+# Fetches currently running, keyed by call, so concurrent identical calls share one
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+def _freeze(value):
+    """Make list arguments (e.g. line item names) usable in an in-flight key."""
+    return tuple(value) if isinstance(value, list) else value
+
+def _singleflight(func: Callable[..., list]) -> Callable[..., list]:
+    """Coalesce concurrent calls with identical arguments into a single fetch."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (
+            func.__name__,
+            tuple(_freeze(arg) for arg in args),
+            tuple(sorted((name, _freeze(value)) for name, value in kwargs.items())),
+        )
+        with _inflight_lock:
+            future = _inflight.get(key)
+            leader = future is None
+            if leader:
+                future = _inflight[key] = Future()
+
+        if not leader:
+            # Copy so callers never share (and mutate) the same list
+            return list(future.result())
+
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with _inflight_lock:
+                del _inflight[key]
+    return wrapper
+
+def _rehydrate(cls, rows: Iterable[dict]) -> list:
+    """Build models from trusted cached rows without re-running validation."""
+    return [cls.model_construct(**row) for row in rows]
+
+def _epoch_dates(timestamps) -> List[str]:
+    """Format epoch seconds as YYYY-MM-DD strings in a single C-level pass."""
+    return np.datetime_as_string(np.asarray(timestamps, dtype="datetime64[s]"), unit="D").tolist()
+
+def _get_profile(ticker: str) -> dict:
+    """Fetch the company profile, reusing a cached copy until it expires."""
+    if (profile := _cache.get_company_profile(ticker)) is not None:
+        return profile
+    profile = polygon_client.get_company_profile(ticker)
+    # An empty profile means the lookup failed; don't pin that for the TTL
+    if profile:
+        _cache.set_company_profile(ticker, profile)
+    return profile
+
+@_singleflight
+def _get_financial_data(ticker: str, period: str) -> List[PolygonFinancialData]:
+    """Fetch and extract reported financials once for both metrics and line items."""
+    if (cached := _cache.get_reported_financials(ticker, period)) is not None:
+        return cached
+    raw_financials = polygon_client.get_raw_reported_financials(ticker, period=period)
+    financial_data_list = _FIN_ADAPTER.extract_financial_data(raw_financials)
+    if financial_data_list:
+        _cache.set_reported_financials(ticker, period, financial_data_list, ttl=FINANCIAL_METRICS_TTL_SECONDS)
+    return financial_data_list
+
+def _financial_context(ticker: str, period: str) -> tuple[dict, List[PolygonFinancialData]]:
+    """Return (company profile, reported financials) for ticker, fetched concurrently."""
+    # The two requests don't depend on each other; overlap them
+    profile_future = _io_executor.submit(_get_profile, ticker)
+    financial_data_list = _get_financial_data(ticker, period)
+    return profile_future.result(), financial_data_list
+
+@_singleflight
 def get_prices(ticker: str, start_date: str, end_date: str) -> List[Price]:
     """Fetch price data from cache or Alpaca API."""
+    _record_hit(ticker)
     
-    if cached_data := _cache.get_prices(ticker):
-        
-        filtered_data = [Price(**price) for price in cached_data if start_date <= price["time"] <= end_date]
-        if filtered_data:
-            return filtered_data
+    if cached_data := _cache.get_prices_range(ticker, start_date, end_date):
+        return _rehydrate(Price, cached_data)
 
     try:
         
@@ -49,29 +166,34 @@ def get_prices(ticker: str, start_date: str, end_date: str) -> List[Price]:
         if data["s"] != "ok":
             raise Exception(f"Error fetching data: {ticker} - {data['s']}")
 
-        
-        prices = []
-        for i in range(len(data["t"])):
-            prices.append(Price(
-                time=datetime.fromtimestamp(data["t"][i]).strftime("%Y-%m-%d"),
-                open=data["o"][i],
-                high=data["h"][i],
-                low=data["l"][i],
-                close=data["c"][i],
-                volume=data["v"][i]
-            ))
-
-        if not prices:
-            return []
-
-        
-        _cache.set_prices(ticker, [p.model_dump() for p in prices])
-        return prices
+        # Build the raw rows once: they are cached as-is and the models are
+        # constructed from them without re-running validation
+        dates = _epoch_dates(data["t"])
+        raw = [
+            {"open": o, "close": c, "high": h, "low": l, "volume": v, "time": time}
+            for time, o, h, l, c, v in zip(dates, data["o"], data["h"], data["l"], data["c"], data["v"])
+        ]
+
+        # Closed bars keep the long lifetime; only today's forming bar is
+        # cached briefly, so live windows don't shorten the history's expiry.
+        # Each part is stored with the dates it covers so a later, wider
+        # request isn't served just the part cached here.
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
+        if start_date < today:
+            closed = [row for row in raw if row["time"] < today]
+            _cache.set_prices(ticker, closed, ttl=PRICES_HISTORICAL_TTL_SECONDS, window=(start_date, min(end_date, yesterday)))
+        if end_date >= today:
+            live = [row for row in raw if row["time"] >= today]
+            _cache.set_prices(ticker, live, ttl=PRICES_LIVE_TTL_SECONDS, window=(max(start_date, today), end_date))
+        return [Price.model_construct(**row) for row in raw]
 
     except Exception as e:
-        logger.error(f"Error fetching prices for {ticker}: {str(e)}")
+        logger.error("Error fetching prices for %s: %s", ticker, e)
         raise
 
+@_singleflight
 def get_financial_metrics(
     ticker: str,
     end_date: str,
@@ -79,35 +201,26 @@ def get_financial_metrics(
     limit: int = 10,
 ) -> List[FinancialMetrics]:
     """Fetch financial metrics from cache or Polygon API using definitive adapter."""
+    _record_hit(ticker)
     
-    if cached_data := _cache.get_financial_metrics(ticker):
-        filtered_data = [FinancialMetrics(**metric) for metric in cached_data
-                        if metric["report_period"] <= end_date and metric.get("period", "ttm") == period]
-        filtered_data.sort(key=lambda x: x.report_period, reverse=True)
-        if filtered_data:
-            return filtered_data[:limit]
+    if cached_data := _cache.get_financial_metrics_range(ticker, None, end_date):
+        # Cached rows are oldest first; walk them backwards for most recent first
+        # Stop at limit matches so only returned rows become models
+        matches = (metric for metric in reversed(cached_data) if metric["period"] == period)
+        if filtered_data := _rehydrate(FinancialMetrics, islice(matches, limit)):
+            return filtered_data
 
     try:
-        from src.external.clients.field_adapters import PolygonFinancialAdapter
-        
-        # Get company profile for market cap and currency
-        profile = polygon_client.get_company_profile(ticker)
-        
-        # Get raw reported financials using new endpoint
-        raw_financials = polygon_client.get_raw_reported_financials(ticker, period=period)
-        
-        # Initialize adapter
-        adapter = PolygonFinancialAdapter()
-        
-        # Extract structured financial data
-        financial_data_list = adapter.extract_financial_data(raw_financials)
+        profile, financial_data_list = _financial_context(ticker, period)
+        adapter = _FIN_ADAPTER
         
         if not financial_data_list:
-            logger.warning(f"No financial data available for {ticker}")
+            logger.warning("No financial data available for %s", ticker)
             return []
         
-        result = []
+        rows = []
         market_cap = profile.get("marketCapitalization")
+        currency = profile.get("currency", "USD")
         
         # Process each financial period
         for data in financial_data_list[:limit]:
@@ -117,80 +230,29 @@ def get_financial_metrics(
             # Determine report period
             report_period = data.period or end_date
             
-            # Create FinancialMetrics object
-            metrics = FinancialMetrics(
-                ticker=ticker,
-                report_period=report_period,
-                period=period,
-                currency=profile.get("currency", "USD"),
-                
-                # Market & Valuation
-                market_cap=calculated_metrics.get("market_cap"),
-                enterprise_value=None,  # Not calculated in basic adapter
-                price_to_earnings_ratio=None,  # Requires stock price
-                price_to_book_ratio=None,  # Requires stock price  
-                price_to_sales_ratio=None,  # Requires stock price
-                enterprise_value_to_ebitda_ratio=None,  # Requires enterprise value
-                enterprise_value_to_revenue_ratio=None,  # Requires enterprise value
-                free_cash_flow_yield=None,  # Requires market cap and FCF
-                peg_ratio=None,  # Requires P/E and growth rate
-                
-                # Profitability & Margins
-                gross_margin=calculated_metrics.get("gross_margin"),
-                operating_margin=calculated_metrics.get("operating_margin"),
-                net_margin=calculated_metrics.get("net_margin"),
-                return_on_equity=calculated_metrics.get("return_on_equity"),
-                return_on_assets=calculated_metrics.get("return_on_assets"),
-                return_on_invested_capital=None,  # Requires ROIC calculation
-                
-                # Activity & Efficiency
-                asset_turnover=calculated_metrics.get("asset_turnover"),
-                inventory_turnover=calculated_metrics.get("inventory_turnover"),
-                receivables_turnover=calculated_metrics.get("receivables_turnover"),
-                days_sales_outstanding=calculated_metrics.get("days_sales_outstanding"),
-                operating_cycle=None,  # Could be calculated
-                working_capital_turnover=None,  # Could be calculated
-                
-                # Liquidity
-                current_ratio=calculated_metrics.get("current_ratio"),
-                quick_ratio=None,  # Requires quick assets calculation
-                cash_ratio=None,  # Could be calculated
-                operating_cash_flow_ratio=calculated_metrics.get("operating_cash_flow_ratio"),
-                
-                # Leverage
-                debt_to_equity=calculated_metrics.get("debt_to_equity"),
-                debt_to_assets=calculated_metrics.get("debt_to_assets"),
-                interest_coverage=None,  # Requires EBIT/Interest calculation
-                
-                # Growth - Not available from single period data
-                revenue_growth=None,
-                earnings_growth=None,
-                book_value_growth=None,
-                earnings_per_share_growth=None,
-                free_cash_flow_growth=None,
-                operating_income_growth=None,
-                ebitda_growth=None,
-                
-                # Per Share
-                earnings_per_share=calculated_metrics.get("earnings_per_share"),
-                book_value_per_share=calculated_metrics.get("book_value_per_share"),
-                free_cash_flow_per_share=calculated_metrics.get("free_cash_flow_per_share"),
-                payout_ratio=None  # Requires dividends data
-            )
-            
-            result.append(metrics)
+            # Start from all-None so metrics the adapter can't derive from a
+            # single period stay None
+            rows.append({
+                **_EMPTY_METRICS,
+                **calculated_metrics,
+                "ticker": ticker,
+                "report_period": report_period,
+                "period": period,
+                "currency": currency,
+            })
         
         # Cache and return results
-        _cache.set_financial_metrics(ticker, [m.model_dump() for m in result])
-        return result[:limit]
+        _cache.set_financial_metrics(ticker, rows, ttl=FINANCIAL_METRICS_TTL_SECONDS, window=(None, end_date))
+        return [FinancialMetrics.model_construct(**row) for row in rows]
         
     except Exception as e:
-        logger.error(f"Error fetching financial metrics for {ticker}: {str(e)}")
+        logger.error("Error fetching financial metrics for %s: %s", ticker, e)
         raise
 
 
 
 
+@_singleflight
 def get_insider_trades(
     ticker: str,
     end_date: str,
@@ -198,14 +260,14 @@ def get_insider_trades(
     limit: int = 1000,
 ) -> List[InsiderTrade]:
     """Fetch insider trades from cache or FinnHub API."""
+    _record_hit(ticker)
     
-    if cached_data := _cache.get_insider_trades(ticker):
-        filtered_data = [InsiderTrade(**trade) for trade in cached_data
-                        if (start_date is None or trade["transaction_date"] >= start_date)
-                        and trade["transaction_date"] <= end_date]
-        filtered_data.sort(key=lambda x: x.transaction_date, reverse=True)
+    if cached_data := _cache.get_insider_trades_range(ticker, start_date, end_date):
+        filtered_data = _rehydrate(InsiderTrade, cached_data[::-1])
         if filtered_data:
             return filtered_data
+    if _cache.is_known_empty("insider_trades", ticker, start_date, end_date):
+        return []
 
     try:
         
@@ -214,43 +276,67 @@ def get_insider_trades(
             from_date=start_date,
             to_date=end_date
         )
+        # None means the lookup failed; only a successful empty answer is
+        # remembered, so a transient error is retried on the next call
+        if data is None:
+            return []
 
-        
-        trades = []
-        for trade in data.get("data", []):
-            
-            transaction_type = "buy" if trade.get("change") > 0 else "sell"
-            shares = abs(trade.get("change", 0))
-            price_per_share = trade.get("price", 0)
-            total_value = shares * price_per_share
-
-            trades.append(InsiderTrade(
-                ticker=ticker,
-                issuer=ticker,  
-                name=trade.get("name", ""),
-                title=trade.get("title", ""),
-                is_board_director=None,  
-                transaction_date=trade.get("transactionDate", ""),
-                transaction_shares=shares,
-                transaction_price_per_share=price_per_share,
-                transaction_value=total_value,
-                shares_owned_before_transaction=None,  
-                shares_owned_after_transaction=None,  
-                security_title="Common Stock",  
-                filing_date=trade.get("filingDate", "")
-            ))
-
-        if not trades:
+        rows = data.get("data", [])
+        if not rows:
+            _cache.mark_empty("insider_trades", ticker, start_date, end_date)
             return []
 
-        
-        _cache.set_insider_trades(ticker, [trade.model_dump() for trade in trades])
-        return trades
+        # Share counts and values for every filing in one vectorized pass
+        count = len(rows)
+        change = np.fromiter((trade.get("change") or 0 for trade in rows), dtype=np.float64, count=count)
+        price = np.fromiter((trade.get("price") or 0 for trade in rows), dtype=np.float64, count=count)
+        shares = np.abs(change)
+        total_value = shares * price
+
+        raw = [
+            {
+                "ticker": ticker,
+                "issuer": ticker,
+                "name": trade.get("name", ""),
+                "title": trade.get("title", ""),
+                "is_board_director": None,
+                "transaction_date": trade.get("transactionDate", ""),
+                "transaction_shares": trade_shares,
+                "transaction_price_per_share": trade_price,
+                "transaction_value": trade_value,
+                "shares_owned_before_transaction": None,
+                "shares_owned_after_transaction": None,
+                "security_title": "Common Stock",
+                "filing_date": trade.get("filingDate", ""),
+            }
+            for trade, trade_shares, trade_price, trade_value
+            in zip(rows, shares.tolist(), price.tolist(), total_value.tolist())
+        ]
+
+        _cache.set_insider_trades(ticker, raw, ttl=INSIDER_TRADES_TTL_SECONDS, window=(start_date, end_date))
+        return [InsiderTrade.model_construct(**row) for row in raw]
 
     except Exception as e:
-        logger.error(f"Error fetching insider trades for {ticker}: {str(e)}")
+        logger.error("Error fetching insider trades for %s: %s", ticker, e)
         raise
 
+def _news_rows(ticker: str, items: List[dict]) -> List[dict]:
+    """Build cache rows for raw news items, formatting all dates in one pass."""
+    dates = _epoch_dates([item.get("datetime", 0) for item in items])
+    return [
+        {
+            "ticker": ticker,
+            "title": item.get("headline", ""),
+            "author": "",
+            "source": item.get("source", ""),
+            "date": date,
+            "url": item.get("url", ""),
+            "sentiment": str(item.get("sentiment", 0)),
+        }
+        for item, date in zip(items, dates)
+    ]
+
+@_singleflight
 def get_company_news(
     ticker: str,
     end_date: str,
@@ -258,72 +344,102 @@ def get_company_news(
     limit: int = 1000,
 ) -> List[CompanyNews]:
     """Fetch company news from cache or FinnHub API."""
+    _record_hit(ticker)
     
-    if cached_data := _cache.get_company_news(ticker):
-        filtered_data = [CompanyNews(**news) for news in cached_data
-                        if (start_date is None or news["date"] >= start_date)
-                        and news["date"] <= end_date]
-        filtered_data.sort(key=lambda x: x.date, reverse=True)
-        if filtered_data:
+    if cached_data := _cache.get_company_news_range(ticker, start_date, end_date):
+        if filtered_data := _rehydrate(CompanyNews, islice(reversed(cached_data), limit)):
             return filtered_data
+    if _cache.is_known_empty("company_news", ticker, start_date, end_date):
+        return []
 
     try:
         
         data = polygon_client.get_company_news(ticker, start_date or "2024-01-01", end_date)
+        # None means the lookup failed; don't remember it as empty
+        if data is None:
+            return []
 
-        
-        news_items = []
-        for item in data:
-            
-            date = datetime.fromtimestamp(item.get("datetime", 0)).strftime("%Y-%m-%d")
-
-            news_items.append(CompanyNews(
-                ticker=ticker,
-                title=item.get("headline", ""),
-                author="",  
-                source=item.get("source", ""),
-                date=date,
-                url=item.get("url", ""),
-                sentiment=str(item.get("sentiment", 0))  
-            ))
-
-        if not news_items:
+        raw = _news_rows(ticker, data)
+        if not raw:
+            _cache.mark_empty("company_news", ticker, start_date, end_date)
             return []
 
-        
-        _cache.set_company_news(ticker, [news.model_dump() for news in news_items])
-        return news_items
+        # Cache the whole page so a later call with a larger limit isn't cut
+        # short; limit only applies to what this call returns
+        _cache.set_company_news(ticker, raw, ttl=COMPANY_NEWS_TTL_SECONDS, window=(start_date, end_date))
+        return _rehydrate(CompanyNews, raw[:limit])
 
     except Exception as e:
-        logger.error(f"Error fetching company news for {ticker}: {str(e)}")
+        logger.error("Error fetching company news for %s: %s", ticker, e)
         raise
 
 def get_market_cap(ticker: str, end_date: str) -> Optional[float]:
-    """Fetch market cap from FinnHub API."""
-    try:
-        
-        quote = polygon_client.get_quote(ticker)
-        return quote.get("marketCap")
-    except Exception as e:
-        logger.error(f"Error fetching market cap for {ticker}: {str(e)}")
-        return None
-
-def prices_to_df(prices: List[Price]) -> pd.DataFrame:
+    """Fetch market cap from the cached company profile, falling back to a live quote."""
+    # Both client calls log and return {} on failure, so a missing value is
+    # just None here rather than an exception
+    profile = _get_profile(ticker)
+    # The profile carries the same ticker-details market cap the quote would
+    if (market_cap := profile.get("marketCapitalization")) is not None:
+        return market_cap
+    market_cap = polygon_client.get_quote(ticker).get("marketCap")
+    if market_cap is not None and profile:
+        # Cache an updated copy so repeat calls skip the quote; the cached
+        # profile itself is shared with concurrent callers and never mutated
+        _cache.set_company_profile(ticker, {**profile, "marketCapitalization": market_cap})
+    return market_cap
+
+# Column layout for price frames; matches PriceNT field order
+_PRICE_DTYPE = np.dtype([
+    ("open", np.float64),
+    ("close", np.float64),
+    ("high", np.float64),
+    ("low", np.float64),
+    ("volume", np.int64),
+    ("time", "U10"),
+])
+
+def _date_index(times) -> pd.DatetimeIndex:
+    """Build the Date index from YYYY-MM-DD strings without pandas format inference."""
+    return pd.DatetimeIndex(np.asarray(times, dtype="datetime64[D]").astype("datetime64[ns]"), name="Date")
+
+def prices_to_df(prices: List[Price] | List[PriceNT]) -> pd.DataFrame:
     """Convert prices to a DataFrame."""
-    df = pd.DataFrame([p.model_dump() for p in prices])
-    df["Date"] = pd.to_datetime(df["time"])
-    df.set_index("Date", inplace=True)
-    numeric_cols = ["open", "close", "high", "low", "volume"]
-    for col in numeric_cols:
-        df[col] = pd.to_numeric(df[col], errors="coerce")
-    df.sort_index(inplace=True)
+    # One pass into a typed buffer; every column comes out with its final dtype
+    records = np.fromiter(
+        ((p.open, p.close, p.high, p.low, p.volume, p.time) for p in prices),
+        dtype=_PRICE_DTYPE,
+        count=len(prices),
+    )
+    df = pd.DataFrame(records)
+    df.index = _date_index(records["time"])
+    # get_prices already returns bars oldest first; only sort other inputs
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
     return df
 
+def _price_rows(ticker: str, start_date: str, end_date: str) -> List[dict]:
+    """Get cached price rows for the range, fetching them first on a miss."""
+    if rows := _cache.get_prices_range(ticker, start_date, end_date):
+        _record_hit(ticker)
+        return rows
+    get_prices(ticker, start_date, end_date)
+    return _cache.get_prices_range(ticker, start_date, end_date)
+
+def get_price_bars(ticker: str, start_date: str, end_date: str) -> List[PriceNT]:
+    """Get prices as lightweight tuples for internal series work, oldest first."""
+    fields = PriceNT._fields
+    return [PriceNT._make([row[field] for field in fields]) for row in _price_rows(ticker, start_date, end_date)]
+
 def get_price_data(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
     """Get price data as DataFrame."""
-    prices = get_prices(ticker, start_date, end_date)
-    return prices_to_df(prices)
+    # Build the frame straight from the cached rows; no Price models needed
+    rows = _price_rows(ticker, start_date, end_date)
+    df = pd.DataFrame.from_records(rows, columns=list(PriceNT._fields))
+    # Cached rows are already sorted by time
+    df.index = _date_index(df["time"].to_numpy())
+    return df
 
+@_singleflight
 def search_line_items(
     ticker: str,
     line_items: List[LineItemName],
@@ -335,81 +451,109 @@ def search_line_items(
     
     # Check cache first
     period_str = period.value if hasattr(period, 'value') else str(period).lower()
-    if cached_data := _cache.get_line_items(ticker):
-        filtered_data = [LineItem(**item) for item in cached_data
-                        if item["report_period"] <= end_date and item.get("period", "ttm") == period_str]
-        filtered_data.sort(key=lambda x: x.report_period, reverse=True)
-        if filtered_data:
-            return filtered_data[:limit]
+    if cached_data := _cache.get_line_items_range(ticker, None, end_date):
+        # Cached rows are oldest first; walk them backwards for most recent first
+        # Stop at limit matches so only returned rows become models
+        matches = (item for item in reversed(cached_data) if item["period"] == period_str)
+        if filtered_data := _rehydrate(LineItem, islice(matches, limit)):
+            return filtered_data
 
     try:
-        from src.external.clients.field_adapters import PolygonFinancialAdapter
-        
-        logger.info(f"Searching line items for {ticker}: {[item.value if hasattr(item, 'value') else str(item) for item in line_items]}")
-        
-        # Get company profile for additional context
-        profile = polygon_client.get_company_profile(ticker)
+        # Normalize enum and string inputs once, outside the per-period loop
+        item_names = [item.value if hasattr(item, 'value') else str(item) for item in line_items]
+        logger.info("Searching line items for %s: %s", ticker, item_names)
         
-        # Get raw reported financials
-        raw_financials = polygon_client.get_raw_reported_financials(ticker, period=period_str)
-        
-        # Initialize adapter
-        adapter = PolygonFinancialAdapter()
-        
-        # Extract structured financial data
-        financial_data_list = adapter.extract_financial_data(raw_financials)
+        profile, financial_data_list = _financial_context(ticker, period_str)
+        adapter = _FIN_ADAPTER
         
         if not financial_data_list:
-            logger.warning(f"No financial data available for {ticker}")
+            logger.warning("No financial data available for %s", ticker)
             return []
         
-        result = []
-        
-        # Process each financial period
-        for financial_data in financial_data_list[:limit]:
-            # Get the definitive field mappings for this data period
-            field_mappings = adapter.get_line_item_mappings(financial_data)
-            
-            # Determine report period
-            report_period = financial_data.period or end_date
-            
-            # Process each requested line item
-            for line_item in line_items:
-                # Handle both enum and string inputs
-                if hasattr(line_item, 'value'):
-                    line_item_str = line_item.value
-                else:
-                    line_item_str = str(line_item)
-                
-                # Get the value using definitive adapter mapping
-                value = field_mappings.get(line_item_str)
-                
-                if value is not None:
-                    result.append(LineItem(
-                        ticker=ticker,
-                        name=line_item_str,
-                        value=float(value),
-                        report_period=report_period,
-                        period=period_str,
-                        currency=profile.get("currency", "USD"),
-                        source="polygon_adapter"
-                    ))
-                    logger.info(f"Found {line_item_str}: {value} for period {report_period}")
-                else:
-                    logger.debug(f"No value found for {line_item_str} in period {report_period}")
+        currency = profile.get("currency", "USD")
+        
+        # Resolve each period's field mappings once, most recent period first
+        # so the rows below come out already in order
+        periods = sorted(
+            (
+                (financial_data.period or end_date, adapter.get_line_item_mappings(financial_data))
+                for financial_data in financial_data_list[:limit]
+            ),
+            key=lambda entry: entry[0],
+            reverse=True,
+        )
         
-        # Sort by report period (most recent first)
-        result.sort(key=lambda x: x.report_period, reverse=True)
+        # One pass over period x item, keeping the hits and logging the misses
+        raw = []
+        for report_period, field_mappings in periods:
+            missing = []
+            for name in item_names:
+                value = field_mappings.get(name)
+                if value is None:
+                    missing.append(name)
+                    continue
+                raw.append({
+                    "ticker": ticker,
+                    "report_period": report_period,
+                    "period": period_str,
+                    "currency": currency,
+                    "name": name,
+                    "value": float(value),
+                    "source": "polygon_adapter",
+                })
+            if missing:
+                logger.debug("No value found for %s in period %s", missing, report_period)
+        
+        result = [LineItem.model_construct(**row) for row in raw[:limit]]
         
         # Cache results
-        if result:
-            _cache.set_line_items(ticker, [item.model_dump() for item in result])
+        if raw:
+            _cache.set_line_items(ticker, raw, window=(None, end_date))
         
-        logger.info(f"Returning {len(result)} line items for {ticker}")
-        return result[:limit]
+        logger.info("Returning %s line items for %s", len(result), ticker)
+        return result
         
     except Exception as e:
-        logger.error(f"Error searching line items for {ticker}: {str(e)}")
+        logger.error("Error searching line items for %s: %s", ticker, e)
         raise
 
- 
\ No newline at end of file
+
+def prefetch_popular_tickers(top_k: int = 10, lookback_days: int = 365) -> List[str]:
+    """Warm the cache with prices and metrics for the most-requested tickers of the last period."""
+    with _ticker_hits_lock:
+        tickers = [ticker for ticker, _ in _ticker_hits.most_common(top_k)]
+        _ticker_hits.clear()
+
+    end = datetime.now()
+    end_date = end.strftime("%Y-%m-%d")
+    start_date = (end - timedelta(days=lookback_days)).strftime("%Y-%m-%d")
+
+    _prefetch_state.active = True
+    try:
+        for ticker in tickers:
+            try:
+                get_prices(ticker, start_date, end_date)
+                get_financial_metrics(ticker, end_date)
+            except Exception as e:
+                logger.warning("Prefetch failed for %s: %s", ticker, e)
+    finally:
+        _prefetch_state.active = False
+
+    return tickers
+
+def start_prefetch_scheduler(
+    interval: float = PREFETCH_INTERVAL_SECONDS,
+    top_k: int = 10,
+) -> threading.Timer:
+    """Run prefetch_popular_tickers every interval seconds on a daemon timer."""
+    def run():
+        try:
+            warmed = prefetch_popular_tickers(top_k)
+            logger.info("Prefetched cache for %s tickers", len(warmed))
+        finally:
+            start_prefetch_scheduler(interval, top_k)
+
+    timer = threading.Timer(interval, run)
+    timer.daemon = True
+    timer.start()
+    return timer
@@ -559,7 +559,7 @@ class PolygonFinancialMetricsAdapter:
         
         return calculated 
 
-@dataclass
+@dataclass(slots=True)
 class PolygonFinancialData:
     """Raw financial data extracted from Polygon response"""
     # Balance Sheet - Assets
@@ -613,6 +613,49 @@ class PolygonFinancialData:
 class PolygonFinancialAdapter:
     """Definitive adapter for Polygon financial data to FinancialMetrics structure"""
     
+    # (statement section, ((PolygonFinancialData field, Polygon key), ...)) read
+    # for every reported period
+    _STATEMENT_FIELDS = (
+        ("balance_sheet", (
+            ("total_assets", "assets"),
+            ("current_assets", "current_assets"),
+            ("noncurrent_assets", "noncurrent_assets"),
+            ("inventory", "inventory"),
+            ("accounts_receivable", "accounts_receivable"),
+            ("fixed_assets", "fixed_assets"),
+            ("intangible_assets", "intangible_assets"),
+            ("other_current_assets", "other_current_assets"),
+            ("other_noncurrent_assets", "other_noncurrent_assets"),
+            ("total_liabilities", "liabilities"),
+            ("current_liabilities", "current_liabilities"),
+            ("noncurrent_liabilities", "noncurrent_liabilities"),
+            ("accounts_payable", "accounts_payable"),
+            ("other_current_liabilities", "other_current_liabilities"),
+            ("wages", "wages"),
+            ("total_equity", "equity"),
+            ("equity_attributable_to_parent", "equity_attributable_to_parent"),
+            ("equity_attributable_to_noncontrolling_interest", "equity_attributable_to_noncontrolling_interest"),
+        )),
+        ("income_statement", (
+            ("revenues", "revenues"),
+            ("cost_of_revenue", "cost_of_revenue"),
+            ("gross_profit", "gross_profit"),
+            ("operating_income", "operating_income_loss"),
+            ("net_income", "net_income_loss"),
+            ("basic_eps", "basic_earnings_per_share"),
+            ("diluted_eps", "diluted_earnings_per_share"),
+            ("basic_shares", "basic_average_shares"),
+            ("diluted_shares", "diluted_average_shares"),
+            ("common_stock_dividends", "common_stock_dividends"),
+        )),
+        ("cash_flow_statement", (
+            ("operating_cash_flow", "net_cash_flow_from_operating_activities"),
+            ("investing_cash_flow", "net_cash_flow_from_investing_activities"),
+            ("financing_cash_flow", "net_cash_flow_from_financing_activities"),
+            ("net_cash_flow", "net_cash_flow"),
+        )),
+    )
+    
     # Exact field mappings - no alternatives, no guessing
     FIELD_MAPPINGS = {
         # Balance Sheet
@@ -652,123 +695,98 @@ class PolygonFinancialAdapter:
     def extract_financial_data(self, polygon_response: Dict[str, Any]) -> List[PolygonFinancialData]:
         """Extract raw financial data from Polygon response"""
         results = []
+        # Hoisted once; the inner loop calls get_value ~32 times per period
+        get_value = self._get_value
+        results_append = results.append
         
         for result in polygon_response.get('results', []):
-            data = PolygonFinancialData()
-            financials = result.get('financials', {})
-            
-            # Extract from balance sheet
-            balance_sheet = financials.get('balance_sheet', {})
-            # Assets
-            data.total_assets = self._get_value(balance_sheet, 'assets')
-            data.current_assets = self._get_value(balance_sheet, 'current_assets')
-            data.noncurrent_assets = self._get_value(balance_sheet, 'noncurrent_assets')
-            data.inventory = self._get_value(balance_sheet, 'inventory')
-            data.accounts_receivable = self._get_value(balance_sheet, 'accounts_receivable')
-            data.fixed_assets = self._get_value(balance_sheet, 'fixed_assets')
-            data.intangible_assets = self._get_value(balance_sheet, 'intangible_assets')
-            data.other_current_assets = self._get_value(balance_sheet, 'other_current_assets')
-            data.other_noncurrent_assets = self._get_value(balance_sheet, 'other_noncurrent_assets')
-            
-            # Liabilities
-            data.total_liabilities = self._get_value(balance_sheet, 'liabilities')
-            data.current_liabilities = self._get_value(balance_sheet, 'current_liabilities')
-            data.noncurrent_liabilities = self._get_value(balance_sheet, 'noncurrent_liabilities')
-            data.accounts_payable = self._get_value(balance_sheet, 'accounts_payable')
-            data.other_current_liabilities = self._get_value(balance_sheet, 'other_current_liabilities')
-            data.wages = self._get_value(balance_sheet, 'wages')
+            result_get = result.get
+            financials_get = result_get('financials', {}).get
             
-            # Equity
-            data.total_equity = self._get_value(balance_sheet, 'equity')
-            data.equity_attributable_to_parent = self._get_value(balance_sheet, 'equity_attributable_to_parent')
-            data.equity_attributable_to_noncontrolling_interest = self._get_value(balance_sheet, 'equity_attributable_to_noncontrolling_interest')
-            
-            # Extract from income statement
-            income_statement = financials.get('income_statement', {})
-            data.revenues = self._get_value(income_statement, 'revenues')
-            data.cost_of_revenue = self._get_value(income_statement, 'cost_of_revenue')
-            data.gross_profit = self._get_value(income_statement, 'gross_profit')
-            data.operating_income = self._get_value(income_statement, 'operating_income_loss')
-            data.net_income = self._get_value(income_statement, 'net_income_loss')
-            data.basic_eps = self._get_value(income_statement, 'basic_earnings_per_share')
-            data.diluted_eps = self._get_value(income_statement, 'diluted_earnings_per_share')
-            data.basic_shares = self._get_value(income_statement, 'basic_average_shares')
-            data.diluted_shares = self._get_value(income_statement, 'diluted_average_shares')
-            data.common_stock_dividends = self._get_value(income_statement, 'common_stock_dividends')
-            
-            # Extract from cash flow statement
-            cash_flow = financials.get('cash_flow_statement', {})
-            data.operating_cash_flow = self._get_value(cash_flow, 'net_cash_flow_from_operating_activities')
-            data.investing_cash_flow = self._get_value(cash_flow, 'net_cash_flow_from_investing_activities')
-            data.financing_cash_flow = self._get_value(cash_flow, 'net_cash_flow_from_financing_activities')
-            data.net_cash_flow = self._get_value(cash_flow, 'net_cash_flow')
+            values = {}
+            for section_name, fields in self._STATEMENT_FIELDS:
+                section = financials_get(section_name, {})
+                for field_name, polygon_key in fields:
+                    values[field_name] = get_value(section, polygon_key)
             
             # Add period information
-            data.period = result.get('end_date', '')
-            data.fiscal_period = result.get('fiscal_period', '')
-            data.timeframe = result.get('timeframe', '')
-            
-            results.append(data)
+            results_append(PolygonFinancialData(
+                **values,
+                period=result_get('end_date', ''),
+                fiscal_period=result_get('fiscal_period', ''),
+                timeframe=result_get('timeframe', ''),
+            ))
             
         return results
     
     def calculate_financial_metrics(self, data: PolygonFinancialData, market_cap: Optional[float] = None) -> Dict[str, Optional[float]]:
         """Calculate all financial metrics from raw data"""
         metrics = {}
-        
+
+        # Bind shared inputs once; several ratios below reuse the same fields
+        revenues = data.revenues
+        net_income = data.net_income
+        total_equity = data.total_equity
+        total_assets = data.total_assets
+        current_liabilities = data.current_liabilities
+        operating_cash_flow = data.operating_cash_flow
+        basic_shares = data.basic_shares
+        revenues_ok = bool(revenues and revenues > 0)
+        current_liabilities_ok = bool(current_liabilities and current_liabilities > 0)
+
         # Basic values
         metrics['market_cap'] = market_cap
         metrics['earnings_per_share'] = data.basic_eps
-        
+
         # Margin calculations
-        if data.revenues and data.revenues > 0:
+        if revenues_ok:
             if data.gross_profit:
-                metrics['gross_margin'] = data.gross_profit / data.revenues
+                metrics['gross_margin'] = data.gross_profit / revenues
             if data.operating_income:
-                metrics['operating_margin'] = data.operating_income / data.revenues  
-            if data.net_income:
-                metrics['net_margin'] = data.net_income / data.revenues
-        
+                metrics['operating_margin'] = data.operating_income / revenues
+            if net_income:
+                metrics['net_margin'] = net_income / revenues
+
         # Liquidity ratios
-        if data.current_assets and data.current_liabilities and data.current_liabilities > 0:
-            metrics['current_ratio'] = data.current_assets / data.current_liabilities
-        
+        if current_liabilities_ok:
+            if data.current_assets:
+                metrics['current_ratio'] = data.current_assets / current_liabilities
+            if operating_cash_flow:
+                metrics['operating_cash_flow_ratio'] = operating_cash_flow / current_liabilities
+
         # Leverage ratios
-        if data.total_equity and data.total_equity > 0:
+        if total_equity and total_equity > 0:
             if data.noncurrent_liabilities:
-                metrics['debt_to_equity'] = data.noncurrent_liabilities / data.total_equity
-            if data.net_income:
-                metrics['return_on_equity'] = data.net_income / data.total_equity
-        
-        if data.total_assets and data.total_assets > 0:
+                metrics['debt_to_equity'] = data.noncurrent_liabilities / total_equity
+            if net_income:
+                metrics['return_on_equity'] = net_income / total_equity
+
+        if total_assets and total_assets > 0:
             if data.total_liabilities:
-                metrics['debt_to_assets'] = data.total_liabilities / data.total_assets
-            if data.net_income:
-                metrics['return_on_assets'] = data.net_income / data.total_assets
-            if data.revenues:
-                metrics['asset_turnover'] = data.revenues / data.total_assets
-        
+                metrics['debt_to_assets'] = data.total_liabilities / total_assets
+            if net_income:
+                metrics['return_on_assets'] = net_income / total_assets
+            if revenues:
+                metrics['asset_turnover'] = revenues / total_assets
+
         # Turnover ratios
-        if data.revenues and data.revenues > 0:
-            if data.accounts_receivable and data.accounts_receivable > 0:
-                metrics['receivables_turnover'] = data.revenues / data.accounts_receivable
-                metrics['days_sales_outstanding'] = 365 / metrics['receivables_turnover']
-            if data.inventory and data.inventory > 0:
-                inventory_turnover = data.cost_of_revenue / data.inventory if data.cost_of_revenue else None
-                if inventory_turnover:
-                    metrics['inventory_turnover'] = inventory_turnover
-        
+        if revenues_ok:
+            accounts_receivable = data.accounts_receivable
+            if accounts_receivable and accounts_receivable > 0:
+                receivables_turnover = revenues / accounts_receivable
+                metrics['receivables_turnover'] = receivables_turnover
+                metrics['days_sales_outstanding'] = 365 / receivables_turnover
+            inventory = data.inventory
+            if inventory and inventory > 0 and data.cost_of_revenue:
+                metrics['inventory_turnover'] = data.cost_of_revenue / inventory
+
         # Per-share calculations
-        if data.basic_shares and data.basic_shares > 0:
-            if data.total_equity:
-                metrics['book_value_per_share'] = data.total_equity / data.basic_shares
-            if data.operating_cash_flow:
-                metrics['free_cash_flow_per_share'] = data.operating_cash_flow / data.basic_shares
-        
-        # Cash flow ratios
-        if data.operating_cash_flow and data.current_liabilities and data.current_liabilities > 0:
-            metrics['operating_cash_flow_ratio'] = data.operating_cash_flow / data.current_liabilities
-            
+        if basic_shares and basic_shares > 0:
+            if total_equity:
+                metrics['book_value_per_share'] = total_equity / basic_shares
+            if operating_cash_flow:
+                metrics['free_cash_flow_per_share'] = operating_cash_flow / basic_shares
+
         return metrics
     
     def _get_value(self, section: Dict[str, Any], field_name: str) -> Optional[float]:
@@ -786,7 +804,7 @@ class PolygonFinancialAdapter:
         # Calculate the enhanced fields first
         estimated_capex = self._estimate_capital_expenditure(financial_data)
         estimated_depreciation = self._estimate_depreciation_and_amortization(financial_data)
-        enhanced_fcf = self._calculate_enhanced_free_cash_flow(financial_data)
+        enhanced_fcf = self._calculate_enhanced_free_cash_flow(financial_data, estimated_capex)
         calculated_working_capital = self._calculate_working_capital(financial_data)
         
         return {
@@ -903,10 +921,9 @@ class PolygonFinancialAdapter:
                 return data.fixed_assets * annual_rate
         return None
     
-    def _calculate_enhanced_free_cash_flow(self, data: PolygonFinancialData) -> Optional[float]:
+    def _calculate_enhanced_free_cash_flow(self, data: PolygonFinancialData, capex: Optional[float]) -> Optional[float]:
         """Calculate free cash flow = Operating Cash Flow - Capital Expenditure."""
         if data.operating_cash_flow:
-            capex = self._estimate_capital_expenditure(data)
             if capex:
                 return data.operating_cash_flow - capex
             else:
@@ -980,11 +997,14 @@ class PolygonFinancialAdapter:
             return data.operating_income + depreciation
         return None
 
+# Stateless, so one instance is shared by every mapping service and caller
+_POLYGON_FINANCIAL_ADAPTER = PolygonFinancialAdapter()
+
 class PolygonFieldMappingService:
     """Service for managing Polygon financial data mappings"""
     
     def __init__(self):
-        self.polygon_adapter = PolygonFinancialAdapter()
+        self.polygon_adapter = _POLYGON_FINANCIAL_ADAPTER
     
     def get_mappings_for_source(self, source: str, period_suffix: str) -> Dict[str, str]:
         """Get field mappings for a specific source"""
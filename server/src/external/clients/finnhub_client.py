@@ -13,6 +13,16 @@ load_dotenv()
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# Period suffixes Finnhub appends to metric keys, and the suffix each
+# accepted ``period`` argument selects.
+_PERIOD_SUFFIXES = ("TTM", "Annual", "Quarterly")
+_SUFFIX_BY_PERIOD = {
+    "ttm": "TTM",
+    "annual": "Annual",
+    "yearly": "Annual",
+    "quarterly": "Quarterly",
+}
+
 class FinnHubClient:
     def __init__(self):
         self.api_key = os.environ.get("FINNHUB_API_KEY")
@@ -97,32 +107,16 @@ class FinnHubClient:
         
         # Filter metrics based on period parameter
         if "metric" in response:
-            filtered_metrics = {}
-            
-            # Determine the suffix to filter by based on period
-            if period.lower() == "ttm":
-                target_suffix = "TTM"
-            elif period.lower() in ["annual", "yearly"]:
-                target_suffix = "Annual"
-            elif period.lower() == "quarterly":
-                target_suffix = "Quarterly"
-            else:
-                # Default to TTM if period not recognized
-                target_suffix = "TTM"
+            # Default to TTM if period not recognized
+            target_suffix = _SUFFIX_BY_PERIOD.get(period.lower(), "TTM")
             
-            # Filter metrics that end with the target suffix or have no suffix (general metrics)
-            for key, value in response["metric"].items():
-                # Include metrics that end with target suffix
-                if key.endswith(target_suffix):
-                    filtered_metrics[key] = value
-                # Include general metrics that don't have period-specific suffixes
-                elif not any(key.endswith(suffix) for suffix in ["TTM", "Annual", "Quarterly"]):
-                    filtered_metrics[key] = value
-                # Special case: for TTM, also include some key metrics without suffix
-                elif target_suffix == "TTM" and key in [
-                    "marketCapitalization", "enterpriseValue", "beta", "52WeekHigh", "52WeekLow"
-                ]:
-                    filtered_metrics[key] = value
+            # Keep metrics that end with the target suffix, plus general
+            # metrics that carry no period suffix at all
+            filtered_metrics = {
+                key: value
+                for key, value in response["metric"].items()
+                if key.endswith(target_suffix) or not key.endswith(_PERIOD_SUFFIXES)
+            }
             
             response["metric"] = filtered_metrics
         
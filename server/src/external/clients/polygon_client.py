@@ -1,6 +1,7 @@
 import os
 import time
 import logging
+import threading
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -23,36 +24,42 @@ class PolygonClient:
         self.rate_limit = 50  # More conservative: 50 requests per minute
         self.requests = []
         self.last_request_time = None
+        # Requests arrive from several threads (gunicorn threads, the shared
+        # I/O pool, the prefetcher); the lock only guards slot bookkeeping
+        self._rate_lock = threading.Lock()
         
     def _wait_for_rate_limit(self):
         """Implement conservative rate limiting logic."""
-        now = datetime.now()
+        # Reserve a slot under the lock but sleep outside it, so callers wait
+        # for their own slots in parallel instead of queueing behind a sleeper
+        with self._rate_lock:
+            slot = self._reserve_request_slot()
+        wait_time = (slot - datetime.now()).total_seconds()
+        if wait_time > 0:
+            logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds...")
+            time.sleep(wait_time)
+    
+    def _reserve_request_slot(self) -> datetime:
+        """Claim the earliest allowed request time; call with _rate_lock held."""
+        slot = datetime.now()
         
-        # Always wait at least 2 seconds between requests to be conservative
+        # Always keep at least 2 seconds between requests to be conservative
         if self.last_request_time:
-            time_since_last = (now - self.last_request_time).total_seconds()
-            if time_since_last < 2.0:
-                wait_time = 2.0 - time_since_last
-                logger.debug(f"Rate limiting: waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-                now = datetime.now()
+            slot = max(slot, self.last_request_time + timedelta(seconds=2))
         
         # Remove requests older than 1 minute
         self.requests = [req_time for req_time in self.requests 
-                        if now - req_time < timedelta(minutes=1)]
+                        if slot - req_time < timedelta(minutes=1)]
         
         if len(self.requests) >= self.rate_limit:
-            # Calculate time to wait
-            oldest_request = self.requests[0]
-            wait_time = 60 - (now - oldest_request).total_seconds() + 5  # Add 5 second buffer
-            if wait_time > 0:
-                logger.info(f"Rate limit reached, waiting {wait_time:.2f} seconds...")
-                time.sleep(wait_time)
-                self.requests = []
-                now = datetime.now()
+            # Wait for the oldest request to leave the window, plus a 5 second buffer
+            slot = max(slot, self.requests[0] + timedelta(seconds=65))
+            logger.info(f"Rate limit reached, next request at {slot:%H:%M:%S}")
+            self.requests = []
         
-        self.requests.append(now)
-        self.last_request_time = now
+        self.requests.append(slot)
+        self.last_request_time = slot
+        return slot
     
     def _execute_with_retry(self, func, *args, max_retries=3, **kwargs):
         """Execute a function with exponential backoff retry on rate limit errors."""
@@ -70,7 +77,8 @@ class PolygonClient:
                                      f"waiting {wait_time} seconds before retry...")
                         time.sleep(wait_time)
                         # Clear request history to reset rate limiting
-                        self.requests = []
+                        with self._rate_lock:
+                            self.requests = []
                         continue
                     else:
                         logger.error(f"Max retries exceeded due to rate limiting: {str(e)}")
@@ -354,6 +362,8 @@ class PolygonClient:
             
             metrics = {}
             series = {"annual": {}, "quarterly": {}}
+            # The latest-value key suffix depends only on the requested period
+            suffix = "TTM" if period.lower() == "ttm" else "Annual"
             
             # Add basic metrics from ticker details
             if ticker_details:
@@ -379,22 +389,19 @@ class PolygonClient:
                         else:
                             period_str = str(period_date)
                         
+                        period_series = series[period_key]
+                        
                         # Process each metric in this financial period
                         for key, value in financial_dict.items():
                             if isinstance(value, (int, float)) and value is not None:
-                                # Initialize series array for this metric if it doesn't exist
-                                if key not in series[period_key]:
-                                    series[period_key][key] = []
-                                
-                                # Add this period's data point to the time series
-                                series[period_key][key].append({
+                                # Add this period's data point to the metric's time series
+                                period_series.setdefault(key, []).append({
                                     "period": period_str,
                                     "v": value
                                 })
                                 
                                 # Update the latest metric value (for the metrics dict)
-                                suffix = "TTM" if period.lower() == "ttm" else "Annual"
-                                metric_key = f"{key}{suffix}"
+                                metric_key = key + suffix
                                 
                                 # Keep the most recent value (financials are usually ordered by date)
                                 if metric_key not in metrics:
@@ -417,8 +424,12 @@ class PolygonClient:
             logger.error(f"Error getting basic financials for {symbol}: {str(e)}")
             return {"metric": {}, "series": {}}
     
-    def get_insider_transactions(self, symbol: str, from_date: str = None, to_date: str = None) -> Dict[str, Any]:
-        """Get insider transactions - Note: Limited availability in Polygon.io API."""
+    def get_insider_transactions(self, symbol: str, from_date: str = None, to_date: str = None) -> Optional[Dict[str, Any]]:
+        """Get insider transactions - Note: Limited availability in Polygon.io API.
+
+        Returns None when the lookup fails, so callers can tell an error from
+        a ticker with no transactions.
+        """
         self._wait_for_rate_limit()
         
         try:
@@ -470,14 +481,14 @@ class PolygonClient:
             except AttributeError:
                 # Method doesn't exist
                 logger.warning(f"Insider transactions endpoint not available in Polygon.io API")
-                return {"data": []}
+                return None
             
         except Exception as e:
             logger.error(f"Error getting insider transactions for {symbol}: {str(e)}")
-            return {"data": []}
+            return None
     
-    def get_company_news(self, symbol: str, start_date: str, end_date: str) -> List[Dict[str, Any]]:
-        """Get company news."""
+    def get_company_news(self, symbol: str, start_date: str, end_date: str) -> Optional[List[Dict[str, Any]]]:
+        """Get company news, or None when the lookup fails."""
         self._wait_for_rate_limit()
         
         try:
@@ -522,7 +533,7 @@ class PolygonClient:
             
         except Exception as e:
             logger.error(f"Error getting company news for {symbol}: {str(e)}")
-            return []
+            return None
     
     def get_quote(self, symbol: str) -> Dict[str, Any]:
         """Get real-time quote."""
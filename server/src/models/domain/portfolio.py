@@ -1,3 +1,4 @@
+import sys
 from typing import Dict, Any, List
 from dataclasses import dataclass, field
 
@@ -77,14 +78,14 @@ class Portfolio:
         positions = {}
         if 'positions' in data:
             positions = {
-                ticker: Position.from_dict(pos_data)
+                sys.intern(ticker): Position.from_dict(pos_data)
                 for ticker, pos_data in data['positions'].items()
             }
         
         realized_gains = {}
         if 'realized_gains' in data:
             realized_gains = {
-                ticker: RealizedGains.from_dict(gains_data)
+                sys.intern(ticker): RealizedGains.from_dict(gains_data)
                 for ticker, gains_data in data['realized_gains'].items()
             }
         
@@ -104,6 +105,8 @@ class Portfolio:
         margin_requirement: float = 0.0
     ) -> 'Portfolio':
         """Create an empty portfolio for the given tickers."""
+        # Intern tickers so position lookups hash-compare by identity
+        tickers = [sys.intern(ticker) for ticker in tickers]
         positions = {
             ticker: Position()
             for ticker in tickers
@@ -1,4 +1,3 @@
-from typing import List, Dict, Any
 from datetime import datetime, timedelta
 import logging
 
@@ -8,6 +7,9 @@ from src.utils.analysts import ANALYST_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Allowed ticker characters, built once rather than per validated ticker
+_TICKER_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-")
+
 class ValidationService:
     """Service for handling business validation logic."""
     
@@ -64,9 +66,8 @@ class ValidationService:
         
         # Validate analysts
         if request_dto.selected_analysts:
-            valid_analysts = self._get_valid_analysts()
             for analyst in request_dto.selected_analysts:
-                if analyst not in valid_analysts:
+                if analyst not in ANALYST_CONFIG:
                     raise ValidationError(f"Invalid analyst: {analyst}")
     
     def validate_date(self, date_str: str) -> bool:
@@ -98,9 +99,4 @@ class ValidationService:
             return False
         
         # Allow letters, numbers, dots, and hyphens
-        allowed_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-")
-        return all(c in allowed_chars for c in ticker.upper())
-    
-    def _get_valid_analysts(self) -> List[str]:
-        """Get list of valid analyst names from ANALYST_CONFIG."""
-        return list(ANALYST_CONFIG.keys()) 
\ No newline at end of file
+        return _TICKER_CHARS.issuperset(ticker.upper()) 
\ No newline at end of file
@@ -133,7 +133,7 @@ class WorkflowService:
     ) -> Generator[str, None, None]:
         """Execute workflow with progress updates using LangGraph's streaming API."""
         
-        # Initial progress
+        # One progress payload per request, updated in place for each event
         progress_event = {
             "type": "progress",
             "stage": "initialization",
@@ -158,64 +158,44 @@ class WorkflowService:
                 
                 # Extract the node name from the step
                 if step and len(step) > 0:
-                    node_name = list(step.keys())[0]
+                    node_name = next(iter(step))
+                    
+                    # Analyst-only fields must not leak into the next event
+                    progress_event.pop("current_analyst", None)
+                    progress_event.pop("analyst_progress", None)
                     
                     if node_name == "start_node":
-                        progress_event = {
-                            "type": "progress",
-                            "stage": "start",
-                            "message": "Initializing workflow...",
-                            "progress": progress_percent,
-                            "timestamp": datetime.now().isoformat()
-                        }
+                        progress_event["stage"] = "start"
+                        progress_event["message"] = "Initializing workflow..."
                     elif node_name.endswith("_agent") and node_name != "risk_management_agent" and node_name != "portfolio_management_agent":
                         # This is an analyst step
                         analyst_name = node_name.replace("_agent", "")
-                        progress_event = {
-                            "type": "progress",
-                            "stage": "analysis",
-                            "message": f"Running {analyst_name} analysis...",
-                            "progress": progress_percent,
-                            "current_analyst": analyst_name,
-                            "analyst_progress": f"{current_step}/{total_steps}",
-                            "timestamp": datetime.now().isoformat()
-                        }
+                        progress_event["stage"] = "analysis"
+                        progress_event["message"] = f"Running {analyst_name} analysis..."
+                        progress_event["current_analyst"] = analyst_name
+                        progress_event["analyst_progress"] = f"{current_step}/{total_steps}"
                     elif node_name == "risk_management_agent":
-                        progress_event = {
-                            "type": "progress",
-                            "stage": "risk_management",
-                            "message": "Running risk management...",
-                            "progress": progress_percent,
-                            "timestamp": datetime.now().isoformat()
-                        }
+                        progress_event["stage"] = "risk_management"
+                        progress_event["message"] = "Running risk management..."
                     elif node_name == "portfolio_management_agent":
-                        progress_event = {
-                            "type": "progress",
-                            "stage": "portfolio_management",
-                            "message": "Running portfolio management...",
-                            "progress": progress_percent,
-                            "timestamp": datetime.now().isoformat()
-                        }
+                        progress_event["stage"] = "portfolio_management"
+                        progress_event["message"] = "Running portfolio management..."
                     else:
-                        progress_event = {
-                            "type": "progress",
-                            "stage": "execution",
-                            "message": f"Executing {node_name}...",
-                            "progress": progress_percent,
-                            "timestamp": datetime.now().isoformat()
-                        }
+                        progress_event["stage"] = "execution"
+                        progress_event["message"] = f"Executing {node_name}..."
                     
+                    progress_event["progress"] = progress_percent
+                    progress_event["timestamp"] = datetime.now().isoformat()
                     yield json.dumps(progress_event) + "\n"
             
             # Yield completion
-            completion_event = {
-                "type": "progress",
-                "stage": "completion",
-                "message": "Analysis completed",
-                "progress": 95,
-                "timestamp": datetime.now().isoformat()
-            }
-            yield json.dumps(completion_event) + "\n"
+            progress_event.pop("current_analyst", None)
+            progress_event.pop("analyst_progress", None)
+            progress_event["stage"] = "completion"
+            progress_event["message"] = "Analysis completed"
+            progress_event["progress"] = 95
+            progress_event["timestamp"] = datetime.now().isoformat()
+            yield json.dumps(progress_event) + "\n"
             
             # Get the final results using invoke
             final_state = agent.invoke(state)
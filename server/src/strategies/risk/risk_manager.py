@@ -1,7 +1,7 @@
 from langchain_core.messages import HumanMessage
 from src.graph.state import AgentState, show_agent_reasoning
 from src.utils.progress import progress
-from src.external.clients.api import get_prices, prices_to_df
+from src.external.clients.api import get_price_bars, prices_to_df
 import json
 
 
@@ -19,7 +19,7 @@ def risk_management_agent(state: AgentState):
     for ticker in tickers:
         progress.update_status("risk_management_agent", ticker, "Analyzing price data")
 
-        prices = get_prices(
+        prices = get_price_bars(
             ticker=ticker,
             start_date=data["start_date"],
             end_date=data["end_date"],
@@ -8,7 +8,7 @@ import json
 import pandas as pd
 import numpy as np
 
-from src.external.clients.api import get_prices, prices_to_df
+from src.external.clients.api import get_price_bars, prices_to_df
 from src.utils.progress import progress
 from src.utils.streaming import with_streaming_progress, emit_ticker_progress
 
@@ -36,7 +36,7 @@ def technical_analyst_agent(state: AgentState):
         progress.update_status("technical_analyst_agent", ticker, "Analyzing price data")
 
         # Get the historical price data
-        prices = get_prices(
+        prices = get_price_bars(
             ticker=ticker,
             start_date=start_date,
             end_date=end_date,
@@ -87,10 +87,10 @@ echo -e "Local URL: ${YELLOW}http://localhost:$PORT${NC}"
 echo -e "Network URL: ${YELLOW}http://$LOCAL_IP:$PORT${NC}"
 echo -e "Press Ctrl+C to stop the server${NC}"
 
-# Start the server
+# Start the server (gunicorn.conf.py binds to $PORT)
 if command -v conda &> /dev/null; then
-  poetry run python src/app.py
+  poetry run gunicorn -c gunicorn.conf.py "app:create_app()"
 else
     echo -e "${YELLOW}Conda not found. Using system Python...${NC}"
-    poetry run python src/app.py
+    poetry run gunicorn -c gunicorn.conf.py "app:create_app()"
 fi
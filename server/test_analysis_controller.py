@@ -0,0 +1,22 @@
+"""Tests for the analysis controller's SSE response headers."""
+
+from src.controllers.analysis_controller import _stream_headers
+
+
+def test_stream_headers_disable_buffering_and_transforms():
+    headers = _stream_headers('HTTP/1.1')
+    assert headers['Cache-Control'] == 'no-cache, no-transform'
+    assert headers['X-Accel-Buffering'] == 'no'
+    # identity is not a valid response content coding
+    assert 'Content-Encoding' not in headers
+
+
+def test_stream_headers_connection_fields_only_on_http11():
+    headers = _stream_headers('HTTP/1.1')
+    assert headers['Connection'] == 'keep-alive'
+    assert headers['Transfer-Encoding'] == 'chunked'
+
+    for protocol in ('HTTP/2', ''):
+        headers = _stream_headers(protocol)
+        assert 'Connection' not in headers
+        assert 'Transfer-Encoding' not in headers
@@ -0,0 +1,255 @@
+"""Tests for the caching behaviour of the data API functions.
+
+Upstream clients are replaced per test, so nothing here touches the network.
+"""
+
+import calendar
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+# The clients are built at import and refuse to start without credentials
+for _name in ("POLYGON_API_KEY", "ALPACA_API_KEY", "ALPACA_API_SECRET"):
+    os.environ.setdefault(_name, "test")
+
+from src.data import cache as cache_module
+from src.data.cache import Cache
+from src.external.clients import api
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    cache = Cache()
+    monkeypatch.setattr(api, "_cache", cache)
+    return cache
+
+
+def _news_item(day: int) -> dict:
+    return {
+        "datetime": 1704067200 + day * 86400,  # 2024-01-01 + day
+        "headline": f"headline {day}",
+        "source": "wire",
+        "url": f"https://example.com/{day}",
+    }
+
+
+def test_company_news_caches_full_page_beyond_limit(monkeypatch):
+    items = [_news_item(day) for day in range(5)]
+    calls = []
+
+    def fake_news(ticker, start_date, end_date):
+        calls.append(ticker)
+        return items
+
+    monkeypatch.setattr(api.polygon_client, "get_company_news", fake_news)
+
+    assert len(api.get_company_news("AAPL", "2024-12-31", limit=2)) == 2
+    # A larger limit is served in full from the cache
+    assert len(api.get_company_news("AAPL", "2024-12-31", limit=10)) == 5
+    assert calls == ["AAPL"]
+
+
+@pytest.mark.parametrize("result, cached_as_empty", [(None, False), ([], True)])
+def test_company_news_negative_caches_only_successful_empty(monkeypatch, result, cached_as_empty):
+    calls = []
+
+    def fake_news(ticker, start_date, end_date):
+        calls.append(ticker)
+        return result
+
+    monkeypatch.setattr(api.polygon_client, "get_company_news", fake_news)
+
+    assert api.get_company_news("AAPL", "2024-12-31") == []
+    assert api.get_company_news("AAPL", "2024-12-31") == []
+    # A failed lookup (None) is retried; a real empty answer is remembered
+    assert len(calls) == (1 if cached_as_empty else 2)
+
+
+@pytest.mark.parametrize("result, cached_as_empty", [(None, False), ({"data": []}, True)])
+def test_insider_trades_negative_caches_only_successful_empty(monkeypatch, result, cached_as_empty):
+    calls = []
+
+    def fake_transactions(ticker, from_date=None, to_date=None):
+        calls.append(ticker)
+        return result
+
+    monkeypatch.setattr(api.polygon_client, "get_insider_transactions", fake_transactions)
+
+    assert api.get_insider_trades("AAPL", "2024-12-31") == []
+    assert api.get_insider_trades("AAPL", "2024-12-31") == []
+    assert len(calls) == (1 if cached_as_empty else 2)
+
+
+def test_live_price_window_keeps_closed_bars_on_historical_ttl(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=lambda: clock.now))
+
+    today = datetime.now().date()
+    days = [today - timedelta(days=offset) for offset in range(4, -1, -1)]
+    bars = {
+        "s": "ok",
+        "t": [calendar.timegm(day.timetuple()) for day in days],
+        "o": [1.0] * 5, "h": [1.0] * 5, "l": [1.0] * 5, "c": [1.0] * 5, "v": [1] * 5,
+    }
+    calls = []
+
+    def fake_prices(ticker, start_date, end_date):
+        calls.append((start_date, end_date))
+        return bars
+
+    monkeypatch.setattr(api.alpaca_client, "get_stock_price", fake_prices)
+
+    start, end = days[0].isoformat(), today.isoformat()
+    assert len(api.get_prices("AAPL", start, end)) == 5
+
+    # Past the live TTL only today's bar has expired
+    clock.now += api.PRICES_LIVE_TTL_SECONDS + 1
+    closed_end = days[-2].isoformat()
+    assert len(api.get_prices("AAPL", start, closed_end)) == 4
+    assert len(calls) == 1
+    assert len(api.get_prices("AAPL", start, end)) == 5
+    assert len(calls) == 2
+
+
+def _reported_financials(end_date: str) -> dict:
+    return {
+        "results": [{
+            "end_date": end_date,
+            "fiscal_period": "Q1",
+            "timeframe": "quarterly",
+            "financials": {
+                "income_statement": {
+                    "revenues": {"value": 100.0},
+                    "net_income_loss": {"value": 10.0},
+                },
+                "balance_sheet": {"equity": {"value": 50.0}},
+            },
+        }],
+    }
+
+
+def test_concurrent_financial_metrics_calls_share_one_fetch(monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def fake_financials(ticker, period="ttm"):
+        calls.append(ticker)
+        release.wait(5)
+        return _reported_financials("2024-03-31")
+
+    monkeypatch.setattr(api.polygon_client, "get_raw_reported_financials", fake_financials)
+    monkeypatch.setattr(api.polygon_client, "get_company_profile", lambda ticker: {"currency": "USD"})
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(api.get_financial_metrics("AAPL", "2024-12-31")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    # Let every caller reach the in-flight fetch before it completes
+    while len(api._inflight) == 0 or len(calls) == 0:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ["AAPL"]
+    assert len(results) == 4
+    assert all(result == results[0] for result in results)
+    # Every caller gets its own list
+    assert len({id(result) for result in results}) == 4
+    assert results[0][0].net_margin == 0.1
+
+
+def test_singleflight_shares_errors_and_clears_in_flight_entry():
+    release = threading.Event()
+    calls = []
+
+    @api._singleflight
+    def failing(ticker):
+        calls.append(ticker)
+        release.wait(5)
+        raise RuntimeError("upstream down")
+
+    errors = []
+
+    def call():
+        try:
+            failing("AAPL")
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while not calls:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ["AAPL"]
+    assert len(errors) == 3
+    assert not any(key[0] == "failing" for key in api._inflight)
+
+
+def test_wider_price_request_is_not_served_a_shorter_cached_window(monkeypatch):
+    calls = []
+
+    def fake_prices(ticker, start_date, end_date):
+        calls.append((start_date, end_date))
+        days = ["2023-01-03", "2024-01-02"] if start_date < "2024-01-01" else ["2024-01-02"]
+        return {
+            "s": "ok",
+            "t": [calendar.timegm(datetime.strptime(day, "%Y-%m-%d").timetuple()) for day in days],
+            "o": [1.0] * len(days), "h": [1.0] * len(days), "l": [1.0] * len(days),
+            "c": [1.0] * len(days), "v": [1] * len(days),
+        }
+
+    monkeypatch.setattr(api.alpaca_client, "get_stock_price", fake_prices)
+
+    # A one-year window, as the prefetcher caches, then a two-year request
+    assert len(api.get_prices("AAPL", "2024-01-01", "2024-12-31")) == 1
+    assert len(api.get_prices("AAPL", "2023-01-01", "2024-12-31")) == 2
+    assert calls == [("2024-01-01", "2024-12-31"), ("2023-01-01", "2024-12-31")]
+    # Anything inside the fetched windows is now a hit
+    assert len(api.get_prices("AAPL", "2023-06-01", "2024-06-30")) == 1
+    assert len(calls) == 2
+
+
+def test_market_cap_fallback_does_not_mutate_the_shared_profile(monkeypatch, fresh_cache):
+    profile = {"currency": "USD"}
+    fresh_cache.set_company_profile("AAPL", profile)
+    quotes = []
+
+    def fake_quote(ticker):
+        quotes.append(ticker)
+        return {"marketCap": 3e12}
+
+    monkeypatch.setattr(api.polygon_client, "get_quote", fake_quote)
+
+    assert api.get_market_cap("AAPL", "2024-12-31") == 3e12
+    assert profile == {"currency": "USD"}
+    # The updated copy is cached, so the quote isn't fetched again
+    assert api.get_market_cap("AAPL", "2024-12-31") == 3e12
+    assert quotes == ["AAPL"]
+
+
+def test_search_line_items_returns_hits_and_logs_misses_once(monkeypatch, caplog):
+    monkeypatch.setattr(api.polygon_client, "get_raw_reported_financials", lambda ticker, period="ttm": _reported_financials("2024-03-31"))
+    monkeypatch.setattr(api.polygon_client, "get_company_profile", lambda ticker: {"currency": "USD"})
+
+    with caplog.at_level("DEBUG", logger=api.logger.name):
+        items = api.search_line_items("AAPL", ["revenue", "net_income", "no_such_item"], "2024-12-31")
+
+    assert {item.name: item.value for item in items} == {"revenue": 100.0, "net_income": 10.0}
+    misses = [record for record in caplog.records if record.getMessage().startswith("No value found")]
+    assert [record.getMessage() for record in misses] == ["No value found for ['no_such_item'] in period 2024-03-31"]
+
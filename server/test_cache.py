@@ -0,0 +1,178 @@
+"""Tests for the in-memory data cache: range lookups, TTLs and negative caching."""
+
+import sys
+import threading
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from src.data import cache as cache_module
+from src.data.cache import Cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(monotonic=fake.monotonic))
+    return fake
+
+
+def _bar(day: str) -> dict:
+    return {"open": 1.0, "close": 1.0, "high": 1.0, "low": 1.0, "volume": 1, "time": day}
+
+
+def test_range_returns_sorted_slice_within_bounds():
+    cache = Cache()
+    cache.set_prices("AAPL", [_bar("2024-01-03"), _bar("2024-01-01"), _bar("2024-01-05")])
+    cache.set_prices("AAPL", [_bar("2024-01-02"), _bar("2024-01-03")])
+
+    rows = cache.get_prices_range("AAPL", "2024-01-02", "2024-01-04")
+    assert [row["time"] for row in rows] == ["2024-01-02", "2024-01-03"]
+    assert [row["time"] for row in cache.get_prices("AAPL")] == [
+        "2024-01-01", "2024-01-02", "2024-01-03", "2024-01-05",
+    ]
+    assert cache.get_prices_range("AAPL", "2024-02-01", "2024-02-28") == []
+    assert cache.get_prices_range("MSFT", "2024-01-01", "2024-01-31") == []
+
+
+def test_open_start_range_includes_everything_up_to_end():
+    cache = Cache()
+    cache.set_company_news("AAPL", [{"date": "2024-01-01"}, {"date": "2024-03-01"}], window=(None, "2024-03-01"))
+    assert [row["date"] for row in cache.get_company_news_range("AAPL", None, "2024-02-01")] == ["2024-01-01"]
+
+
+def test_range_must_be_covered_by_fetched_windows():
+    cache = Cache()
+    cache.set_prices("AAPL", [_bar("2024-01-02"), _bar("2024-06-28")], window=("2024-01-01", "2024-06-30"))
+
+    # Rows overlap a wider request, but half of it was never fetched
+    assert cache.get_prices_range("AAPL", "2023-01-01", "2024-06-30") == []
+    assert cache.get_prices_range("AAPL", "2024-01-01", "2024-12-31") == []
+    assert cache.get_prices_range("AAPL", None, "2024-06-30") == []
+    assert len(cache.get_prices_range("AAPL", "2024-01-01", "2024-06-30")) == 2
+
+    # Overlapping fetches together cover the union
+    cache.set_prices("AAPL", [_bar("2024-09-03")], window=("2024-06-30", "2024-12-31"))
+    assert len(cache.get_prices_range("AAPL", "2024-01-01", "2024-12-31")) == 3
+
+
+def test_fetched_windows_expire_with_their_ttl(clock):
+    cache = Cache()
+    cache.set_prices("AAPL", [_bar("2024-01-02")], ttl=60, window=("2024-01-01", "2024-01-31"))
+    cache.set_prices("AAPL", [], ttl=600, window=("2024-02-01", "2024-02-29"))
+
+    clock.now += 60
+    assert cache.get_prices_range("AAPL", "2024-01-01", "2024-01-31") == []
+    # An empty window still counts as fetched, so there is nothing to return
+    assert cache.get_prices_range("AAPL", "2024-02-01", "2024-02-29") == []
+
+
+@pytest.fixture
+def fast_switching():
+    """Switch threads very often so readers land between a writer's steps."""
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(previous)
+
+
+def test_concurrent_writes_never_expose_mismatched_rows(fast_switching):
+    cache = Cache()
+    days = [(date(2000, 1, 1) + timedelta(days=offset)).isoformat() for offset in range(2000)]
+    stop = threading.Event()
+    bad = []
+
+    def write(chunk):
+        for start in range(0, len(chunk), 50):
+            cache.set_prices("AAPL", [_bar(day) for day in chunk[start:start + 50]])
+
+    def read():
+        while not stop.is_set():
+            rows = cache.get_prices_range("AAPL", days[500], days[600])
+            bad.extend(row["time"] for row in rows if not days[500] <= row["time"] <= days[600])
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    writers = [threading.Thread(target=write, args=(days[offset::4],)) for offset in range(4)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert bad == []
+    # No concurrent merge lost another writer's rows
+    assert [row["time"] for row in cache.get_prices("AAPL")] == days
+
+
+def test_rows_expire_after_ttl(clock):
+    cache = Cache()
+    cache.set_prices("AAPL", [_bar("2024-01-01"), _bar("2024-01-02")], ttl=60)
+
+    clock.now += 59
+    assert len(cache.get_prices_range("AAPL", "2024-01-01", "2024-01-02")) == 2
+    clock.now += 1
+    assert cache.get_prices_range("AAPL", "2024-01-01", "2024-01-02") == []
+
+
+def test_short_ttl_write_does_not_shorten_existing_rows(clock):
+    cache = Cache()
+    historical = [_bar(f"2024-01-0{day}") for day in range(1, 6)]
+    cache.set_prices("AAPL", historical, ttl=6 * 60 * 60)
+    # A live window overlapping the history, plus today's forming bar
+    cache.set_prices("AAPL", historical[-2:] + [_bar("2024-01-08")], ttl=60)
+
+    clock.now += 120
+    assert len(cache.get_prices_range("AAPL", "2024-01-01", "2024-01-05")) == 5
+    # Only the range that includes the expired live bar is a miss
+    assert cache.get_prices_range("AAPL", "2024-01-01", "2024-01-08") == []
+
+
+def test_expired_rows_are_replaced_on_the_next_write(clock):
+    cache = Cache()
+    cache.set_prices("AAPL", [{**_bar("2024-01-01"), "close": 1.0}], ttl=60)
+    clock.now += 60
+    cache.set_prices("AAPL", [{**_bar("2024-01-01"), "close": 2.0}], ttl=60)
+
+    rows = cache.get_prices_range("AAPL", "2024-01-01", "2024-01-01")
+    assert [row["close"] for row in rows] == [2.0]
+
+
+def test_rows_without_ttl_never_expire(clock):
+    cache = Cache()
+    cache.set_line_items("AAPL", [{"report_period": "2024-03-31", "name": "revenue"}], window=(None, "2024-12-31"))
+    clock.now += 10 ** 9
+    rows = cache.get_line_items_range("AAPL", None, "2024-12-31")
+    assert rows == [{"report_period": "2024-03-31", "name": "revenue", "period": "ttm"}]
+
+
+def test_known_empty_expires(clock):
+    cache = Cache()
+    assert not cache.is_known_empty("company_news", "AAPL", None, "2024-12-31")
+
+    cache.mark_empty("company_news", "AAPL", None, "2024-12-31", ttl=300)
+    assert cache.is_known_empty("company_news", "AAPL", None, "2024-12-31")
+    # Keyed by the full range and dataset
+    assert not cache.is_known_empty("company_news", "AAPL", "2024-01-01", "2024-12-31")
+    assert not cache.is_known_empty("insider_trades", "AAPL", None, "2024-12-31")
+
+    clock.now += 300
+    assert not cache.is_known_empty("company_news", "AAPL", None, "2024-12-31")
+
+
+def test_company_profile_expires(clock):
+    cache = Cache()
+    cache.set_company_profile("AAPL", {"currency": "USD"}, ttl=10)
+    assert cache.get_company_profile("AAPL") == {"currency": "USD"}
+    clock.now += 10
+    assert cache.get_company_profile("AAPL") is None
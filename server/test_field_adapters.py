@@ -0,0 +1,32 @@
+"""Tests for the Polygon field adapters."""
+
+from src.external.clients.field_adapters import PolygonFinancialAdapter
+
+
+def test_extract_financial_data_maps_every_statement_field():
+    polygon_response = {
+        "results": [{
+            "end_date": "2024-03-31",
+            "fiscal_period": "Q1",
+            "timeframe": "quarterly",
+            "financials": {
+                section: {polygon_key: {"value": index} for index, (_, polygon_key) in enumerate(fields)}
+                for section, fields in PolygonFinancialAdapter._STATEMENT_FIELDS
+            },
+        }, {
+            "end_date": "2023-12-31",
+            "financials": {"income_statement": {"revenues": {"value": "5"}, "net_income_loss": {}}},
+        }],
+    }
+    first, second = PolygonFinancialAdapter().extract_financial_data(polygon_response)
+
+    for _, fields in PolygonFinancialAdapter._STATEMENT_FIELDS:
+        for index, (field_name, _) in enumerate(fields):
+            assert getattr(first, field_name) == float(index)
+    assert (first.period, first.fiscal_period, first.timeframe) == ("2024-03-31", "Q1", "quarterly")
+
+    # Missing sections and fields without a value come back as None
+    assert second.revenues == 5.0
+    assert second.net_income is None
+    assert second.total_assets is None
+    assert second.fiscal_period == ""
@@ -0,0 +1,61 @@
+"""Tests for the Polygon client's request rate limiter."""
+
+import os
+import threading
+from datetime import datetime, timedelta
+
+os.environ.setdefault("POLYGON_API_KEY", "test")
+
+from src.external.clients import polygon_client as polygon_module
+from src.external.clients.polygon_client import PolygonClient
+
+
+def test_rate_limit_sleeps_outside_the_lock(monkeypatch):
+    client = PolygonClient()
+    client.last_request_time = datetime.now()
+    lock_free_while_sleeping = []
+
+    def fake_sleep(seconds):
+        acquired = client._rate_lock.acquire(blocking=False)
+        lock_free_while_sleeping.append(acquired)
+        if acquired:
+            client._rate_lock.release()
+
+    monkeypatch.setattr(polygon_module.time, "sleep", fake_sleep)
+
+    client._wait_for_rate_limit()
+    assert lock_free_while_sleeping == [True]
+
+
+def test_concurrent_callers_get_spaced_slots():
+    client = PolygonClient()
+    client.last_request_time = datetime.now()
+    slots = []
+    slots_lock = threading.Lock()
+
+    def reserve():
+        with client._rate_lock:
+            slot = client._reserve_request_slot()
+        with slots_lock:
+            slots.append(slot)
+
+    threads = [threading.Thread(target=reserve) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    slots.sort()
+    assert all(later - earlier >= timedelta(seconds=2) for earlier, later in zip(slots, slots[1:]))
+
+
+def test_full_minute_window_pushes_the_slot_past_the_oldest_request():
+    client = PolygonClient()
+    now = datetime.now()
+    client.requests = [now - timedelta(seconds=30)] * client.rate_limit
+
+    with client._rate_lock:
+        slot = client._reserve_request_slot()
+
+    assert slot >= now + timedelta(seconds=35)
+    assert client.requests == [slot]
@@ -0,0 +1,44 @@
+"""Tests for request payload validation."""
+
+from src.utils.validators import validate_analysis_request
+
+
+def test_valid_request_has_no_errors():
+    data = {
+        'tickers': ['AAPL'],
+        'start_date': '2024-01-01',
+        'end_date': None,
+        'initial_cash': 1000,
+        'margin_requirement': 0.5,
+        'show_reasoning': True,
+        'selected_analysts': None,
+        'model_name': 'gpt-4o',
+        'model_provider': 'OpenAI',
+    }
+    assert validate_analysis_request(data) == []
+
+
+def test_tickers_are_required_and_must_be_a_list():
+    assert validate_analysis_request({}) == ["Field 'tickers' is required"]
+    assert validate_analysis_request({'tickers': 'AAPL'}) == ["Field 'tickers' must be a list"]
+
+
+def test_optional_fields_are_type_checked_in_order():
+    data = {
+        'tickers': ['AAPL'],
+        'start_date': 20240101,
+        'initial_cash': '1000',
+        'show_reasoning': 'yes',
+        'model_name': None,
+    }
+    assert validate_analysis_request(data) == [
+        "Field 'start_date' must be a string",
+        "Field 'initial_cash' must be a number",
+        "Field 'show_reasoning' must be a boolean",
+        "Field 'model_name' must be a string",
+    ]
+
+
+def test_none_is_only_accepted_where_allowed():
+    data = {'tickers': ['AAPL'], 'selected_analysts': None, 'margin_requirement': None}
+    assert validate_analysis_request(data) == ["Field 'margin_requirement' must be a number"]